@@ -1,22 +1,46 @@
 import csv
 import io
+import json
 import operator
 import os
-import pickle
 import re
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import date as Date
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Iterable
+from typing import IO, Any, ClassVar, Iterable, Iterator, cast
+from urllib.parse import urlencode
 
 import requests
-from bs4 import BeautifulSoup as bs  # type: ignore
 from cachetools import TTLCache, cachedmethod
 from loguru import logger
+from lxml import html as lhtml  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:
+    # Optional speedup; `./run.sh install speed`. stdlib json otherwise.
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from cachecontrol import CacheControlAdapter  # type: ignore[import]
+    from cachecontrol.caches.file_cache import FileCache  # type: ignore[import]
+except ImportError:
+    # Optional: lets idempotent GETs revalidate with ETag/Last-Modified
+    # and skip re-downloading unchanged bodies. `./run.sh install speed`.
+    CacheControlAdapter = None  # type: ignore[assignment, misc]
+    FileCache = None  # type: ignore[assignment, misc]
 
 from .response_objects import (
+    CUSTOMER_SPEND_COLUMNS,
+    RESERVATION_COLUMNS,
     Animal,
     AnimalReservationIds,
     CustomerSpend,
@@ -43,6 +67,26 @@ USER_AGENT = os.getenv(
 """Not sure if matters but use it anyways."""
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 """Raise GingrClientError after too many bad/timed out requests. Default is 3."""
+APIKEY_TTL = int(os.getenv("APIKEY_TTL", "3000"))
+"""How long (seconds) a saved apikey is trusted before re-scraping the dashboard."""
+SESSION_TTU = int(os.getenv("SESSION_TTU", "900"))
+"""Cookies younger than this (seconds) are trusted without even a HEAD probe."""
+
+try:
+    import brotli  # type: ignore[import]  # noqa: F401
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    # Only advertise br when urllib3 can actually decode it.
+    ACCEPT_ENCODING = "gzip, deflate"
+"""Transfer compression; orthogonal to the zipped-CSV payloads."""
+
+_ZIP_MAGIC = b"PK\x03\x04"
+"""First 4 bytes of a zip file; cheaper than zipfile.is_zipfile's EOCD seek."""
+_TRAILING_ID_RE = re.compile(r"/(\d+)$")
+"""Numeric id on the end of an href like /report_cards/edit/123."""
+_FILE_ID_RE = re.compile(r"files\[(\d+)\]")
+"""File id inside a bulk_upload select name like files[2275938][file][]."""
 
 
 class GingrClientError(Exception):
@@ -52,13 +96,41 @@ class GingrClientError(Exception):
 
 
 class EnhancedSession(requests.Session):
-    """Add timeout to every request made with the session."""
+    """Add timeout to every request made with the session.
+
+    Also mounts a connection pool big enough that threaded callers
+    (see `Client.get_animals`) reuse keep-alive connections instead of
+    re-doing the TLS handshake once more than 10 are in flight.
+    """
 
     def __init__(
         self, timeout: tuple[float, float] | float | int = (3.05, 27.0)
     ) -> None:
         self.timeout = timeout
-        return super().__init__()
+        super().__init__()
+        # Retry transient failures at the adapter level: backoff, honors
+        # Retry-After, and keeps the keep-alive pool alive across retries.
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+        )
+        # Everything goes to the one gingrapp host.
+        pool_kwargs: dict[str, Any] = dict(
+            pool_connections=1, pool_maxsize=32, pool_block=True, max_retries=retry
+        )
+        if CacheControlAdapter is not None:
+            adapter: HTTPAdapter = CacheControlAdapter(
+                cache=FileCache(
+                    os.path.join(tempfile.gettempdir(), "gingr-httpcache")
+                ),
+                **pool_kwargs,
+            )
+        else:
+            adapter = HTTPAdapter(**pool_kwargs)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
 
     def request(self, method: str | bytes, url: str, **kwargs: Any):  # type: ignore
         if "timeout" not in kwargs:
@@ -73,7 +145,7 @@ class Client:
     TODO document MAX_RETRIES
 
     Prefer to fetch json data from the api but some data is only available in
-    rendered HTML so we use BeautifulSoup to get it.
+    rendered HTML so we use lxml to get it.
 
     icon_templates
     group_icons
@@ -81,6 +153,13 @@ class Client:
     custom_icons
     """
 
+    reservation_types: ClassVar[TTLCache] = TTLCache(maxsize=32, ttl=3600)
+    """Shared by every Client, keyed by (subdomain, location); an entry is
+    only re-fetched from gingr when > 3600 seconds old."""
+
+    _rtypes_lock: ClassVar[threading.RLock] = threading.RLock()
+    """Guards the shared reservation_types cache for threaded callers."""
+
     def __init__(
         self,
         subdomain: str,
@@ -98,17 +177,31 @@ class Client:
         self.timeout = timeout
         """See https://requests.readthedocs.io/en/latest/user/advanced/#timeouts"""
         self.base_url = f"https://{subdomain}.gingrapp.com"
+        self.auth_url = f"{self.base_url}/auth/login"
+        self.dash_url = f"{self.base_url}/dashboard"
         self.cookie_file = Path(tempfile.gettempdir()) / Path(
             f"{self.subdomain}-{self.username}.cookiefile"
         )
         """This is supposed to work on windows and unixy OS but only tested on unix"""
-        self.apikey: str | None = None
-        """Set on first authenticated request."""
-        self._session = self._establish_session()
-        self.reservation_types: Iterable[ReservationType] = TTLCache(
-            maxsize=100, ttl=3600
+        self.meta_file = Path(tempfile.gettempdir()) / Path(
+            f"{self.subdomain}-{self.username}.meta.json"
         )
-        """Will only be updated from gingr if > 3600 seconds since last update."""
+        """Saved apikey so warm starts skip the dashboard HTML parse."""
+        self.rtypes_file = Path(tempfile.gettempdir()) / Path(
+            f"{self.subdomain}-{self.location}-rtypes.json"
+        )
+        """Saved reservation types so short-lived scripts skip the fetch."""
+        self._apikey: str | None = None
+        """Set on login or lazily scraped from the dashboard HTML."""
+        self._login_lock = threading.Lock()
+        """So concurrent workers hitting an expired session don't all re-login."""
+        self._inflight: dict[tuple, Future] = {}
+        """In-flight GETs keyed by (url, params) so duplicates can piggyback."""
+        self._inflight_lock = threading.Lock()
+        self._etags: dict[tuple, tuple[str, ResponseType]] = {}
+        """(url, params) -> (etag, parsed body) for revalidating GETs."""
+        self._session = self._establish_session()
+        self._load_reservation_types()
 
     @classmethod
     def from_env(cls) -> "Client":
@@ -121,18 +214,34 @@ class Client:
             raise GingrClientError("Login details not provided")
 
     @property
-    def auth_url(self) -> str:
-        return f"{self.base_url}/auth/login"
-
-    @property
-    def dash_url(self) -> str:
-        return f"{self.base_url}/dashboard"
+    def apikey(self) -> str:
+        """Found in the dashboard HTML; only fetched when first needed."""
+        if self._apikey is None:
+            resp = self.get(self.dash_url)
+            self._apikey = self._extract_window_apikey(resp)  # type: ignore[arg-type]
+            self._save_apikey()
+        return self._apikey
 
     def _get_session(self) -> EnhancedSession:
         session = EnhancedSession(self.timeout)
         session.headers["User-Agent"] = USER_AGENT
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
         return session
 
+    def _probe_dash(self, session: requests.Session) -> requests.Response:
+        """Cheap dashboard probe for checking whether the session is live.
+
+        HEAD is enough to see the 302; no need to download the whole
+        dashboard just to check cookie validity. Falls back to a
+        streamed-and-closed GET in case gingr ever stops answering HEAD,
+        so a 405 never masquerades as a valid session.
+        """
+        response = session.head(self.dash_url, allow_redirects=False)
+        if response.status_code == 405:
+            response = session.get(self.dash_url, allow_redirects=False, stream=True)
+            response.close()
+        return response
+
     def _establish_session(self) -> requests.Session:
         """
         First we try to reuse existing cookies but if that doesn't work
@@ -143,15 +252,27 @@ class Client:
         if Path(self.cookie_file).exists():
             logger.info("Loading cookies from existing cookiefile")
             session = self._get_session()
-            cookies = self.load_cookies(self.cookie_file)
-            for c in cookies:
-                session.cookies[c.name] = c.value
+            try:
+                session.cookies.update(self.load_cookies(self.cookie_file))
+            except (ValueError, UnicodeDecodeError, KeyError):
+                # Corrupt or old-format (pickled) cookiefile
+                logger.info("Could not read cookiefile; need to login")
+                return self._login()
 
-            response = session.get(self.dash_url, allow_redirects=False)
-            if self._session_expired(response):
+            cookie_age = time.time() - self.cookie_file.stat().st_mtime
+            if cookie_age < SESSION_TTU:
+                # Saved minutes ago; trust it outright. If gingr expired
+                # it early anyway, the first request lands on the login
+                # page; _session_expired spots the followed redirect and
+                # get/post re-send after the re-login.
+                self._apikey = self._load_apikey()
+                logger.info("Cookiefile fresh; skipping session probe")
+                return session
+
+            if self._session_expired(self._probe_dash(session)):
                 return self._login()
 
-            self.apikey = self._extract_window_apikey(response.text)
+            self._apikey = self._load_apikey()
             logger.info("Previous session still valid")
             return session
 
@@ -188,78 +309,235 @@ class Client:
             raise GingrClientError("Unable to login")
         logger.info("Successfully logged in")
 
-        self.apikey = self._extract_window_apikey(response.text)
+        self._apikey = self._extract_window_apikey(response.text)
+        self._save_apikey()
         self.save_cookies(session.cookies, self.cookie_file)
 
         return session
 
+    def _save_apikey(self) -> None:
+        """Stash the apikey beside the cookiefile for the next process."""
+        with open(self.meta_file, "w") as f:
+            json.dump({"apikey": self._apikey, "saved_at": time.time()}, f)
+
+    def _load_apikey(self) -> str | None:
+        """Return the saved apikey if it is still fresh enough to trust."""
+        try:
+            with open(self.meta_file) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - meta.get("saved_at", 0) < APIKEY_TTL:
+            return meta.get("apikey")
+        return None
+
     def _session_expired(self, response: requests.Response) -> bool:
-        """Returns whether gingr wants the client to re-login."""
-        if response.status_code == 302:
-            location = response.headers.get("location", "")
-            if location == self.auth_url:
-                logger.info("Session/cookies expired; need to re-login")
-                return True
+        """Returns whether gingr wants the client to re-login.
+
+        get/post follow redirects, so on those paths an expired session
+        shows up as an already-consumed 302 chain ending on the login
+        page, not as the 302 itself; only the allow_redirects=False
+        probes ever see the raw 302. Runs on every response, so bail on
+        the cheap checks before touching the headers dict.
+        """
+        if response.history and response.url.startswith(self.auth_url):
+            logger.info("Session/cookies expired; need to re-login")
+            return True
+        if response.status_code != 302:
+            return False
+        location = response.headers.get("location")
+        if location is not None and location == self.auth_url:
+            logger.info("Session/cookies expired; need to re-login")
+            return True
         return False
 
     def _get_from_content_type(self, resp: requests.Response) -> ResponseType:
-        content_type = resp.headers["content-type"]
-        if content_type == "application/csv" or content_type == '"text/csv"':
-            return self._extract_csv(resp)
-        elif "application/json" in content_type:
-            json_resp = resp.json()
-            if json_resp.get("error", False) or not json_resp.get("success", True):
-                logger.critical(json_resp)
-                self._log_bad_request(resp)
-                raise GingrClientError("Error in json response")
-            return json_resp
-        elif "text/html" in content_type:
-            return resp.text
-        else:
-            return resp
+        """Dispatch on the normalized media type; unknown types pass through raw."""
+        ctype = resp.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        handler = self._DISPATCH.get(ctype)
+        return handler(self, resp) if handler else resp
+
+    def _as_json(self, resp: requests.Response) -> dict:
+        # orjson parses bytes directly, skipping the text decode that
+        # resp.json() does first.
+        json_resp = orjson.loads(resp.content) if orjson else resp.json()
+        if json_resp.get("error", False) or not json_resp.get("success", True):
+            logger.critical(json_resp)
+            self._log_bad_request(resp)
+            raise GingrClientError("Error in json response")
+        return json_resp
+
+    def _as_html(self, resp: requests.Response) -> str:
+        return resp.text
 
     def _extract_csv(self, response: requests.Response) -> Iterable[dict]:
-        if zipfile.is_zipfile(io.BytesIO(response.content)):
-            return csv.DictReader(self.unzip(response.content))
-        csv_part = response.text.split("<!DOCTYPE html>")[0]
-        return csv.DictReader(io.StringIO(csv_part))
-
-    def post(self, url: str, data: dict) -> ResponseType:
-        """Wraps POST request and return result based on Content-Type header."""
-        attempts = 0
-        while attempts < MAX_RETRIES:
+        """Stream rows out of a CSV response instead of buffering the body.
+
+        Reports can run to several MB; feeding the wire straight into
+        DictReader keeps memory constant and yields the first row before
+        the download finishes. Zipped payloads still need the full body
+        because the zip directory lives at the end of the file.
+        """
+        response.raw.decode_content = True
+        head = response.raw.read(4)
+        if head == _ZIP_MAGIC:
+            return csv.DictReader(self.unzip(head + response.raw.read()))
+        # urllib3's HTTPResponse reads like a binary file but the stubs
+        # don't say so; the cast is the whole workaround.
+        raw = cast(IO[bytes], response.raw)
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        return csv.DictReader(self._csv_lines(head.decode("utf-8"), text))
+
+    @staticmethod
+    def _csv_lines(head: str, text: IO[str]) -> Iterable[str]:
+        """Yield CSV lines, stopping at the HTML blob gingr appends."""
+
+        def readline() -> str:
             try:
-                resp = self._session.post(url, data=data)
-                logger.info(f"POST {url} {data} {resp.status_code} {resp.reason}")
-            except requests.exceptions.RequestException as exc:
-                logger.exception(exc)
-                attempts += 1
-                continue
-            if self._session_expired(resp):
-                self._session = self._login()
-            return self._get_from_content_type(resp)
+                return text.readline()
+            except ValueError:
+                # urllib3 closes the stream once it's fully read, which
+                # turns the usual "" at EOF into a closed-file error.
+                return ""
+
+        # If the header row is shorter than the 4-byte zip probe, head
+        # already holds a newline and this first chunk is several lines.
+        for line in (head + readline()).splitlines(keepends=True):
+            if line.startswith("<!DOCTYPE html>"):
+                return
+            yield line
+        line = readline()
+        while line:
+            if line.startswith("<!DOCTYPE html>"):
+                return
+            yield line
+            line = readline()
 
-        logger.critical("Too many bad requests")
-        raise GingrClientError("Too many bad requests")
+    @staticmethod
+    def _header_index(reader: csv.DictReader, required: Iterable[str]) -> dict:
+        """Map column name -> position, failing loudly on schema drift.
 
-    def get(self, url: str, params: dict | None = None) -> ResponseType:
-        """Wraps GET request and return result based on Content-Type header."""
-        attempts = 0
-        while attempts < MAX_RETRIES:
+        Without this check a renamed or dropped column would make every
+        row fail its try/except and the generator silently yield nothing.
+        """
+        idx = {name: n for n, name in enumerate(reader.fieldnames or [])}
+        missing = [c for c in required if c not in idx]
+        if missing:
+            logger.critical(reader.fieldnames)
+            raise GingrClientError(f"Report missing expected columns: {missing}")
+        return idx
+
+    _DISPATCH: ClassVar[dict] = {
+        "application/csv": _extract_csv,
+        '"text/csv"': _extract_csv,  # yes, gingr quotes it sometimes
+        "application/json": _as_json,
+        "text/html": _as_html,
+    }
+    """Normalized content-type -> handler; anything else returns the Response."""
+
+    def post(self, url: str, data: dict | str | bytes) -> ResponseType:
+        """Wraps POST request and return result based on Content-Type header.
+
+        data may be a dict or an already urlencoded form body.
+        """
+        headers = (
+            {"Content-Type": "application/x-www-form-urlencoded"}
+            if isinstance(data, (str, bytes))
+            else None
+        )
+        for _ in range(2):
             try:
-                resp = self._session.get(url, params=params)
-                logger.info(f"GET {url} {params} {resp.status_code} {resp.reason}")
+                resp = self._session.post(url, data=data, headers=headers, stream=True)
             except requests.exceptions.RequestException as exc:
+                # The adapter already retried MAX_RETRIES times with backoff.
+                logger.critical("Too many bad requests")
                 logger.exception(exc)
-                attempts += 1
-                continue
+                raise GingrClientError("Too many bad requests") from exc
+            # Positional args so loguru only formats (and only touches
+            # a potentially large body) when the log actually emits.
+            logger.info("POST {} {} {} {}", url, data, resp.status_code, resp.reason)
+            if not self._session_expired(resp):
+                break
+            # Second pass re-sends on the fresh session; the expired
+            # attempt only bought us a login page.
+            self._relogin()
+        return self._get_from_content_type(resp)
+
+    def get(
+        self, url: str, params: dict | None = None, revalidate: bool = False
+    ) -> ResponseType:
+        """Wraps GET request and return result based on Content-Type header.
+
+        Identical GETs issued concurrently (e.g. thread-pool workers all
+        refreshing reservation types on a cold cache) collapse into one
+        network call; the duplicates just wait for the first.
+
+        With revalidate=True the previous ETag for this url is sent as
+        If-None-Match; a 304 reuses the previously parsed body instead of
+        downloading and parsing it again. Only use it for endpoints that
+        parse eagerly (json/html) — a replayed CSV stream is already spent.
+        """
+        key = (url, tuple(sorted(params.items())) if params else None)
+        with self._inflight_lock:
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                fut: Future = Future()
+                self._inflight[key] = fut
+        if waiting is not None:
+            return waiting.result()
+        try:
+            result = self._get(url, params, key if revalidate else None)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
-            if self._session_expired(resp):
+    def _get(
+        self,
+        url: str,
+        params: dict | None = None,
+        etag_key: tuple | None = None,
+    ) -> ResponseType:
+        headers = None
+        if etag_key is not None and etag_key in self._etags:
+            headers = {"If-None-Match": self._etags[etag_key][0]}
+        for _ in range(2):
+            try:
+                resp = self._session.get(
+                    url, params=params, headers=headers, stream=True
+                )
+            except requests.exceptions.RequestException as exc:
+                # The adapter already retried MAX_RETRIES times with backoff.
+                logger.critical("Too many bad requests")
+                logger.exception(exc)
+                raise GingrClientError("Too many bad requests") from exc
+            logger.info("GET {} {} {} {}", url, params, resp.status_code, resp.reason)
+            if not self._session_expired(resp):
+                break
+            # Second pass re-sends on the fresh session; the expired
+            # attempt only bought us a login page.
+            self._relogin()
+        if etag_key is not None:
+            if resp.status_code == 304:
+                return self._etags[etag_key][1]
+            result = self._get_from_content_type(resp)
+            etag = resp.headers.get("etag")
+            if etag:
+                self._etags[etag_key] = (etag, result)
+            return result
+        return self._get_from_content_type(resp)
+
+    def _relogin(self) -> None:
+        """Re-login exactly once when many threads see the expiry together."""
+        with self._login_lock:
+            # Whoever held the lock first may have already fixed the session.
+            if self._session_expired(self._probe_dash(self._session)):
                 self._session = self._login()
-            return self._get_from_content_type(resp)
-
-        logger.critical("Too many bad requests")
-        raise GingrClientError("Too many bad requests")
 
     def get_section_counts(self) -> SessionCounts:
         """Return summary of animals checked_in, going_home, etc."""
@@ -270,7 +548,11 @@ class Client:
         logger.critical(resp)
         raise GingrClientError("get_section_counts() resp not json")
 
-    @cachedmethod(operator.attrgetter("reservation_types"))
+    @cachedmethod(
+        operator.attrgetter("reservation_types"),
+        key=lambda self: (self.subdomain, self.location),
+        lock=operator.attrgetter("_rtypes_lock"),
+    )
     def get_reservation_types(self) -> Iterable[ReservationType]:
         """These are cached with an hour TTL."""
         url = f"{self.base_url}/api/v1/reservation_types_by_booking_category"
@@ -280,45 +562,113 @@ class Client:
             "location_id": self.location,
             "fetch_only_other_location": 0,
         }
-        resp = self.get(url, params)
+        resp = self.get(url, params, revalidate=True)
         try:
-            r_types = resp.get("reservation_types", [])  # type: ignore
-            return [ReservationType.from_json(r_type) for r_type in r_types]
+            r_types = [
+                ReservationType.from_json(r_type)
+                for r_type in resp.get("reservation_types", [])  # type: ignore
+            ]
         except Exception as exc:
             logger.critical(resp)
             logger.exception(exc)
             raise GingrClientError("get_reservation_types()") from exc
+        self._save_reservation_types(r_types)
+        return r_types
+
+    def _save_reservation_types(self, r_types: list[ReservationType]) -> None:
+        """Write the types to tempdir so the next process skips the fetch."""
+        tmp = self.rtypes_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump([asdict(r) for r in r_types], f)
+        os.replace(tmp, self.rtypes_file)
+
+    def _load_reservation_types(self) -> None:
+        """Seed the shared cache from disk if a fresh enough copy exists.
+
+        JSON rather than pickle for the same reason as the cookiefile.
+        """
+        key = (self.subdomain, self.location)
+        with self._rtypes_lock:
+            if key in self.reservation_types:
+                return
+            try:
+                if time.time() - self.rtypes_file.stat().st_mtime >= 3600:
+                    return
+                with open(self.rtypes_file) as f:
+                    dicts = json.load(f)
+                self.reservation_types[key] = [ReservationType(**d) for d in dicts]
+            except (OSError, ValueError, TypeError):
+                return
+
+    @cachedmethod(
+        operator.attrgetter("reservation_types"),
+        key=lambda self: ("type_ids", self.subdomain, self.location),
+        lock=operator.attrgetter("_rtypes_lock"),
+    )
+    def _type_ids_body(self) -> str:
+        """Pre-encoded type_ids[] form chunk, cached beside the types.
+
+        Re-encoding the same id list for every get_reservations call
+        within the TTL window is wasted work.
+        """
+        return urlencode(
+            {"type_ids[]": [r.id for r in self.get_reservation_types()]}, doseq=True
+        )
 
     def get_reservations(
         self,
         reservation_types: Iterable[ReservationType] | None = None,
         date: Date | None = None,
         days_ahead: int = 1,
-    ) -> Iterable[Reservation]:
+    ) -> Iterator[Reservation]:
         """Return all reservations from the date plus days_ahead.
 
         date defaults to today if not provided
         """
         date_from = date if date else Date.today()
         date_to = date_from + timedelta(days=days_ahead)
-        reservation_types = (
-            reservation_types if reservation_types else self.get_reservation_types()
+        if reservation_types:
+            type_ids = urlencode(
+                {"type_ids[]": [r.id for r in reservation_types]}, doseq=True
+            )
+        else:
+            type_ids = self._type_ids_body()
+        # Encode the form once ourselves; requests' dict encoding would
+        # re-iterate the type id list on every call.
+        data = (
+            urlencode(
+                {
+                    "date_from": f"{date_from:%m/%d/%Y}",
+                    "date_to": f"{date_to:%m/%d/%Y}",
+                    "cancelled": "true",
+                    "csv": "true",
+                }
+            )
+            + "&"
+            + type_ids
         )
-        data = {
-            "date_from": date_from.strftime("%m/%d/%Y"),
-            "date_to": date_to.strftime("%m/%d/%Y"),
-            "type_ids[]": [r.id for r in reservation_types],
-            "cancelled": "true",
-            "csv": "true",
-        }
         url = f"{self.base_url}/reports/reservations_by_days"
         resp = self.post(url, data=data)
-        try:
-            return [Reservation.from_csv(row) for row in resp]  # type: ignore
-        except Exception as exc:
-            logger.critical(resp)
-            logger.exception(exc)
-            raise GingrClientError("get_reservations()") from exc
+        if isinstance(resp, csv.DictReader):
+            # Read positionally off the underlying reader; building a
+            # 50-key dict per row is most of DictReader's cost.
+            idx = self._header_index(resp, RESERVATION_COLUMNS)
+            for row in resp.reader:
+                try:
+                    yield Reservation.from_row(row, idx)
+                except Exception as exc:
+                    # One malformed row shouldn't kill the whole report.
+                    logger.critical(row)
+                    logger.exception(exc)
+            return
+        # Anything else iterable here is already row dicts; the cast
+        # keeps the loop variable from inheriting the ResponseType union.
+        for dict_row in cast(Iterable[dict], resp):
+            try:
+                yield Reservation.from_csv(dict_row)
+            except Exception as exc:
+                logger.critical(dict_row)
+                logger.exception(exc)
 
     def get_icons(
         self, animal_ids: Iterable[int], owner_ids: Iterable[int] | None = None
@@ -329,8 +679,10 @@ class Client:
         """
         url = f"{self.dash_url}/get_icons"
         data = {
-            "animal_ids": str(animal_ids),
-            "owner_ids": str(owner_ids) if owner_ids else "[]",
+            # Real JSON, not Python repr: C-level encoding and no risk of
+            # a tuple/set repr the server can't parse.
+            "animal_ids": json.dumps(list(animal_ids)),
+            "owner_ids": json.dumps(list(owner_ids)) if owner_ids else "[]",
             "key": self.apikey,
         }
         # lol that `get_icons` is a POST.
@@ -353,6 +705,18 @@ class Client:
             logger.exception(exc)
             raise GingrClientError("get_animal()") from exc
 
+    def get_animals(
+        self, animal_ids: Iterable[int], workers: int = 16
+    ) -> Iterable[Animal]:
+        """Fetch many animal profiles concurrently.
+
+        Pure I/O-bound work so threads sharing the session's keep-alive
+        pool overlap the round trips. Keep workers <= the adapter's
+        pool_maxsize (32) or the extra threads just block on connections.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_animal, animal_ids))
+
     def get_animal_reservation_ids(self, animal_id: int) -> AnimalReservationIds:
         """Return ids of all future, complete, cancelled, wait listed reservations."""
         url = f"{self.base_url}/api/v1/reservation_stats"
@@ -382,37 +746,52 @@ class Client:
 
     def get_customer_spend_by_date_range(
         self, date_from: Date, date_to: Date
-    ) -> Iterable[CustomerSpend]:
+    ) -> Iterator[CustomerSpend]:
         """Return customer and amount they have spent over the date range."""
         url = f"{self.base_url}/reports/customer_spend"
         data = {
-            "date_from": date_from.strftime("%m/%d/%Y"),
-            "date_to": date_to.strftime("%m/%d/%Y"),
+            "date_from": f"{date_from:%m/%d/%Y}",
+            "date_to": f"{date_to:%m/%d/%Y}",
             "payment_amount_min": "1.00",
             "csv": "true",
         }
         resp = self.post(url, data)
-        try:
-            return [CustomerSpend.from_csv(row) for row in resp]  # type: ignore
-        except Exception as exc:
-            raise GingrClientError("get_customer_spend_by_date_range()") from exc
+        if isinstance(resp, csv.DictReader):
+            idx = self._header_index(resp, CUSTOMER_SPEND_COLUMNS)
+            for row in resp.reader:
+                try:
+                    yield CustomerSpend.from_row(row, idx)
+                except Exception as exc:
+                    logger.critical(row)
+                    logger.exception(exc)
+            return
+        for dict_row in cast(Iterable[dict], resp):
+            try:
+                yield CustomerSpend.from_csv(dict_row)
+            except Exception as exc:
+                logger.critical(dict_row)
+                logger.exception(exc)
 
     def get_unsent_report_cards(self) -> Iterable[UnsentReportCard]:
         """Return unsent report cards and number of photos in each one."""
         url = f"{self.base_url}/report_cards"
         resp = self.get(url)
 
-        unsent_div = bs(resp, "lxml").find("div", {"id": "unsent"})
-        tbody = unsent_div.find("tbody")
-
+        # lxml's C-side XPath is much cheaper than walking a BeautifulSoup
+        # tree row by row.
+        doc = lhtml.fromstring(resp)
         ret = []
-        for row in tbody.find_all("tr"):  # type: ignore
-            cols = row.find_all("td")
+        for row in doc.xpath('//div[@id="unsent"]//tbody/tr'):
+            cols = row.findall("td")
             report_card_id = int(
-                cols[0].find("a", {"title": "Edit"})["href"].split("/")[-1]
+                _TRAILING_ID_RE.search(
+                    cols[0].xpath('.//a[@title="Edit"]/@href')[0]
+                ).group(1)  # type: ignore[union-attr]
             )
-            a_id = int(cols[1].find("a")["href"].split("/")[-1])
-            num_files = int(cols[4].text)
+            a_id = int(
+                _TRAILING_ID_RE.search(cols[1].xpath(".//a/@href")[0]).group(1)  # type: ignore[union-attr]  # noqa: E501
+            )
+            num_files = int(cols[4].text_content())
             ret.append(UnsentReportCard(a_id, report_card_id, num_files))
         return ret
 
@@ -420,14 +799,9 @@ class Client:
         """Returns all report card urls for the animal."""
         url = f"{self.base_url}/animals/view/id/{animal_id}"
         resp = self.get(url)
-        report_cards_div = bs(resp, "lxml").find("div", {"id": "report_cards"})
-        tbody = report_cards_div.find("tbody")
-        urls = []
-        for row in tbody.find_all("tr"):
-            cols = row.find_all("td")
-            url = cols[0].find("a")["href"]
-            urls.append(url)
-        return urls
+        return lhtml.fromstring(resp).xpath(
+            '//div[@id="report_cards"]//tbody/tr/td[1]//a/@href'
+        )
 
     def get_animal_report_card_ids(self, animal_id: int) -> Iterable[int]:
         """Returns all report card ids for the animal."""
@@ -443,20 +817,16 @@ class Client:
         url = f"{self.base_url}/report_cards/bulk_upload"
         resp = self.get(url)
 
-        tbody = bs(resp, "lxml").find("tbody")
-        if not tbody:
-            return ret
-
-        for row in tbody.find_all("tr"):  # type: ignore
-            cols = row.find_all("td")
-            try:
-                url = cols[0].find("img")["src"].replace("https ", "https:")
-                # <select multiple="" name="files[2275938][file][]">
-                file_thing = cols[1].find("select")["name"]
-                file_id = int(file_thing.replace("files[", "").replace("][file][]", ""))
-                ret.append((UntaggedImage(file_id, url)))
-            except TypeError:
+        doc = lhtml.fromstring(resp)
+        for row in doc.xpath("//tbody/tr"):
+            srcs = row.xpath("./td[1]//img/@src")
+            # <select multiple="" name="files[2275938][file][]">
+            names = row.xpath("./td[2]//select/@name")
+            if not srcs or not names:
                 continue
+            url = srcs[0].replace("https ", "https:")
+            file_id = int(_FILE_ID_RE.match(names[0]).group(1))  # type: ignore[union-attr]  # noqa: E501
+            ret.append(UntaggedImage(file_id, url))
         return ret
 
     def upload_image(self, image: str | Path) -> None:
@@ -480,10 +850,16 @@ class Client:
         #         print(resp.headers)
         #         print(resp.content)
 
-    def clear_bulk_upload(self) -> None:
-        """Delete all images in the bulk_upload section."""
-        for image in self.get_untagged_images():
-            self.delete_image(image.file_id)
+    def clear_bulk_upload(self, workers: int = 16) -> None:
+        """Delete all images in the bulk_upload section.
+
+        Each delete is its own round trip so run them concurrently over
+        the shared keep-alive pool like `get_animals` does.
+        """
+        images = self.get_untagged_images()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(lambda i: self.delete_image(i.file_id), images):
+                pass
 
     def tag_images(self, tags: Iterable) -> None:
         """Assign tags to images in bulk_upload."""
@@ -509,37 +885,62 @@ class Client:
 
     @staticmethod
     def _extract_window_apikey(html: str) -> str:
-        """Found by scrolling through view source."""
-        with io.StringIO(html) as stream:
-            for line in stream:
-                apikey = re.search("window.apiKey = ", line)
-                if apikey:
-                    return line.split(" = ")[-1].replace("'", "").strip().strip(";")
-        raise GingrClientError("Could not get apikey")
+        """Found by scrolling through view source.
+
+        A single find() beats line-iterating the whole page with a regex.
+        """
+        marker = "window.apiKey = "
+        start = html.find(marker)
+        if start == -1:
+            raise GingrClientError("Could not get apikey")
+        end = html.find("\n", start)
+        if end == -1:
+            end = len(html)
+        return html[start + len(marker) : end].strip().strip(";").strip("'")
 
     @staticmethod
     def unzip(content: bytes) -> Iterable[str]:
-        """Return first file in the zip archive."""
-        with io.BytesIO(content) as stream:
-            with zipfile.ZipFile(stream) as zipped:
-                zip_contents = zipped.namelist()
-                if len(zip_contents) == 1:
-                    with zipped.open(zip_contents[0]) as target_file:
-                        return io.StringIO(target_file.read().decode("utf-8"))
-                else:
-                    # I've never seen gingr send more than one file in the zip.
-                    raise GingrClientError("Not sure which file to read in zip.")
+        """Return the first file in the zip archive as a lazy text stream.
+
+        No `with` blocks on purpose: they would close the handles before
+        the caller's DictReader ever read a line. The ZipFile stays alive
+        as long as the returned wrapper does and decompresses on demand
+        instead of decoding the whole file up front.
+        """
+        zipped = zipfile.ZipFile(io.BytesIO(content))
+        zip_contents = zipped.namelist()
+        if len(zip_contents) != 1:
+            # I've never seen gingr send more than one file in the zip.
+            raise GingrClientError("Not sure which file to read in zip.")
+        return io.TextIOWrapper(zipped.open(zip_contents[0]), encoding="utf-8")
 
     @staticmethod
     def save_cookies(cookies: Any, filename: Path) -> None:
-        """Pickle the cookies in /tmp."""
-        with open(filename, "wb") as f:
-            pickle.dump(cookies, f)
+        """Write the cookies to a JSON file in /tmp.
+
+        Plain JSON rather than pickle so a swapped cookiefile can't run
+        arbitrary code on the next load.
+        """
+        dicts = [
+            {
+                "name": c.name,
+                "value": c.value,
+                "domain": c.domain,
+                "path": c.path,
+                "expires": c.expires,
+            }
+            for c in cookies
+        ]
+        with open(filename, "w") as f:
+            json.dump(dicts, f)
             logger.info("Saved cookiefile")
 
     @staticmethod
-    def load_cookies(filename: Path) -> Any:
-        """UnPickle the cookies in /tmp."""
-        with open(filename, "rb") as f:
-            cookies = pickle.load(f)
-        return cookies
+    def load_cookies(filename: Path) -> requests.cookies.RequestsCookieJar:
+        """Read the cookies back out of the JSON file in /tmp."""
+        with open(filename) as f:
+            dicts = json.load(f)
+        jar = requests.cookies.RequestsCookieJar()
+        for d in dicts:
+            jar.set_cookie(requests.cookies.create_cookie(**d))
+        return jar
@@ -89,12 +89,14 @@ lint() {
 }
 
 tests() {
-    wrapped-python -X dev -m unittest tests/test_client.py
+    # xdist spreads the live-server round trips over all cores; the
+    # suite is RTT-bound so wall time drops to roughly the slowest test.
+    wrapped-python -X dev -m pytest -n auto tests/test_client.py
 }
 
 test() {
     wrapped-python -X dev \
-        -m unittest "tests.test_client.ClientTestCase.test_${1}"
+        -m pytest tests/test_client.py -k "test_${1}"
 }
 
 docs() {
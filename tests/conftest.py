@@ -0,0 +1,44 @@
+"""Shared pytest fixtures for the live-server client tests."""
+
+import functools
+from pathlib import Path
+
+import pytest
+import vcr
+
+from gingrwrapp import Client
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+_vcr = vcr.VCR(
+    cassette_library_dir=str(CASSETTE_DIR),
+    record_mode="new_episodes",
+    # Drop the apikey query param from recording and matching so
+    # rotated credentials still replay the same cassette.
+    filter_query_parameters=["key"],
+)
+
+
+@pytest.fixture(autouse=True)
+def vcr_cassette(request):
+    """Record each test's live responses once, replay them on reruns.
+
+    Cassettes are gitignored, so CI and fresh clones always make at
+    least one real pass against the server.
+    """
+    with _vcr.use_cassette(f"{request.node.name}.yaml"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One logged-in Client per worker, built lazily.
+
+    As a fixture (rather than a module global) it costs nothing during
+    collection or when -k filters every test out.
+    """
+    client = Client.from_env()
+    # Several tests hit the same animal id; memoize on this instance
+    # only, so the production class stays cache-free.
+    client.get_animal = functools.lru_cache(maxsize=None)(client.get_animal)
+    return client